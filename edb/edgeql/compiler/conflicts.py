@@ -23,6 +23,10 @@
 from __future__ import annotations
 from typing import *
 
+import collections
+import itertools
+import uuid
+
 from edb import errors
 from edb.common import context as pctx
 
@@ -30,7 +34,8 @@ from edb.ir import ast as irast
 from edb.ir import typeutils
 
 from edb.schema import constraints as s_constr
-from edb.schema import name as s_name
+from edb.schema import expr as s_expr
+from edb.schema import objects as s_obj
 from edb.schema import objtypes as s_objtypes
 from edb.schema import pointers as s_pointers
 from edb.schema import utils as s_utils
@@ -46,14 +51,54 @@ from . import setgen
 from . import typegen
 
 
+def _get_subjectexpr(
+    constr: s_constr.Constraint,
+    *, ctx: context.ContextLevel,
+) -> Optional[s_expr.Expression]:
+    cache = ctx.env.constr_subjectexpr_cache
+    if constr.id not in cache:
+        cache[constr.id] = constr.get_subjectexpr(ctx.env.schema)
+    return cache[constr.id]
+
+
+def _find_subject_ptrs(
+    obj: Union[s_constr.Constraint, s_pointers.Pointer],
+    expr: s_expr.Expression,
+    *, ctx: context.ContextLevel,
+) -> FrozenSet[str]:
+    cache = ctx.env.subject_ptrs_cache
+    ptrs = cache.get(obj.id)
+    if ptrs is None:
+        ptrs = cache[obj.id] = frozenset(
+            qlutils.find_subject_ptrs(expr.qlast))
+    return ptrs
+
+
+def _get_pointers_by_name(
+    typ: s_objtypes.ObjectType,
+    *, ctx: context.ContextLevel,
+) -> Dict[str, s_pointers.Pointer]:
+    # getptr() builds a name index of all pointers on every call, so
+    # build it once per type instead.
+    cache = ctx.env.pointers_by_name_cache
+    ptrs = cache.get(typ.id)
+    if ptrs is None:
+        schema = ctx.env.schema
+        ptrs = cache[typ.id] = {
+            name.name: ptr
+            for name, ptr in typ.get_pointers(schema).items(schema)
+        }
+    return ptrs
+
+
 def _compile_conflict_select(
     stmt: irast.MutatingStmt,
     subject_typ: s_objtypes.ObjectType,
     *,
     for_inheritance: bool,
-    fake_dml_set: Optional[irast.Set],
+    get_fake_dml_set: Optional[Callable[[], irast.Set]],
     obj_constrs: Sequence[s_constr.Constraint],
-    constrs: Dict[str, Tuple[s_pointers.Pointer, List[s_constr.Constraint]]],
+    constrs: PointerConstraintMap,
     parser_context: Optional[pctx.ParserContext],
     ctx: context.ContextLevel,
 ) -> Optional[qlast.Expr]:
@@ -64,79 +109,99 @@ def _compile_conflict_select(
 
     `cnstrs` contains the constraints to consider.
     """
+    # N.B: Compiling the anchors below may add derived objects to
+    # ctx.env.schema, but we only use this to look at objects that
+    # already exist.
+    schema = ctx.env.schema
+    ptrs_by_name = _get_pointers_by_name(subject_typ, ctx=ctx)
+
     # Find which pointers we need to grab
     needed_ptrs = set(constrs)
     for constr in obj_constrs:
-        subjexpr = constr.get_subjectexpr(ctx.env.schema)
+        subjexpr = _get_subjectexpr(constr, ctx=ctx)
         assert subjexpr
-        needed_ptrs |= qlutils.find_subject_ptrs(subjexpr.qlast)
+        needed_ptrs |= _find_subject_ptrs(constr, subjexpr, ctx=ctx)
 
-    wl = list(needed_ptrs)
+    # Chase references from computed pointers; needed_ptrs doubles
+    # as the set of names already queued.
+    wl = collections.deque(needed_ptrs)
     ptr_anchors = {}
     while wl:
-        p = wl.pop()
-        ptr = subject_typ.getptr(ctx.env.schema, s_name.UnqualName(p))
-        if expr := ptr.get_expr(ctx.env.schema):
+        p = wl.popleft()
+        ptr = ptrs_by_name[p]
+        if expr := ptr.get_expr(schema):
             assert isinstance(expr.qlast, qlast.Expr)
             ptr_anchors[p] = expr.qlast
-            for ref in qlutils.find_subject_ptrs(expr.qlast):
-                if ref not in needed_ptrs:
-                    wl.append(ref)
-                    needed_ptrs.add(ref)
+            new_refs = _find_subject_ptrs(ptr, expr, ctx=ctx) - needed_ptrs
+            needed_ptrs |= new_refs
+            wl.extend(new_refs)
+
+    shape_by_name: Dict[str, irast.Set] = {}
+    for elem, _ in stmt.subject.shape:
+        assert elem.rptr is not None
+        shape_by_name.setdefault(elem.rptr.ptrref.shortname.name, elem)
+    ptrs_in_shape = shape_by_name.keys()
+
+    if for_inheritance and not ptrs_in_shape:
+        return None
 
     ctx.anchors = ctx.anchors.copy()
 
     # If we are given a fake_dml_set to directly represent the result
     # of our DML, use that instead of populating the result.
+    fake_dml_set = get_fake_dml_set() if get_fake_dml_set else None
     if fake_dml_set:
-        for p in needed_ptrs | {'id'}:
-            ptr = subject_typ.getptr(ctx.env.schema, s_name.UnqualName(p))
+        id_ptr: Tuple[str, ...] = () if 'id' in needed_ptrs else ('id',)
+        for p in itertools.chain(needed_ptrs, id_ptr):
+            ptr = ptrs_by_name[p]
             val = setgen.extend_path(fake_dml_set, ptr, ctx=ctx)
 
             ptr_anchors[p] = ctx.create_anchor(val, p)
 
     # Find the IR corresponding to the fields we care about and
     # produce anchors for them
-    ptrs_in_shape = set()
-    for elem, _ in stmt.subject.shape:
-        assert elem.rptr is not None
-        name = elem.rptr.ptrref.shortname.name
-        ptrs_in_shape.add(name)
-        if name in needed_ptrs and name not in ptr_anchors:
-            assert elem.expr
-            if inference.infer_volatility(elem.expr, ctx.env).is_volatile():
-                if for_inheritance:
-                    error = (
-                        'INSERT does not support volatile properties with '
-                        'exclusive constraints when another statement in '
-                        'the same query modifies a related type'
-                    )
-                else:
-                    error = (
-                        'INSERT UNLESS CONFLICT ON does not support volatile '
-                        'properties'
-                    )
-                raise errors.UnsupportedFeatureError(
-                    error, context=parser_context
+    for name in needed_ptrs & ptrs_in_shape:
+        if name in ptr_anchors:
+            continue
+        elem = shape_by_name[name]
+        assert elem.expr
+        if inference.infer_volatility(elem.expr, ctx.env).is_volatile():
+            if for_inheritance:
+                error = (
+                    'INSERT does not support volatile properties with '
+                    'exclusive constraints when another statement in '
+                    'the same query modifies a related type'
                 )
+            else:
+                error = (
+                    'INSERT UNLESS CONFLICT ON does not support volatile '
+                    'properties'
+                )
+            raise errors.UnsupportedFeatureError(
+                error, context=parser_context
+            )
 
-            # FIXME: The wrong thing will definitely happen if there are
-            # volatile entries here
-            ptr_anchors[name] = ctx.create_anchor(
-                setgen.ensure_set(elem.expr, ctx=ctx), name)
-
-    if for_inheritance and not ptrs_in_shape:
-        return None
+        # FIXME: The wrong thing will definitely happen if there are
+        # volatile entries here
+        ptr_anchors[name] = ctx.create_anchor(
+            setgen.ensure_set(elem.expr, ctx=ctx), name)
 
     # Fill in empty sets for pointers that are needed but not present
     present_ptrs = set(ptr_anchors)
-    for p in (needed_ptrs - present_ptrs):
-        ptr = subject_typ.getptr(ctx.env.schema, s_name.UnqualName(p))
-        typ = ptr.get_target(ctx.env.schema)
+    # Missing pointers frequently share target types
+    typerefs: Dict[uuid.UUID, qlast.TypeExpr] = {}
+    for p in needed_ptrs:
+        if p in present_ptrs:
+            continue
+        ptr = ptrs_by_name[p]
+        typ = ptr.get_target(schema)
         assert typ
+        if (typeref := typerefs.get(typ.id)) is None:
+            typeref = typerefs[typ.id] = typegen.type_to_ql_typeref(
+                typ, ctx=ctx)
         ptr_anchors[p] = qlast.TypeCast(
             expr=qlast.Set(elements=[]),
-            type=typegen.type_to_ql_typeref(typ, ctx=ctx))
+            type=typeref)
 
     if not ptr_anchors:
         raise errors.QueryError(
@@ -144,8 +209,11 @@ def _compile_conflict_select(
             context=parser_context,
         )
 
+    # Only the constraint subject expressions are schema ASTs that get
+    # substituted into again; the anchors above are built per call.
+    paths_cache = ctx.env.subject_expr_paths_cache
     conds: List[qlast.Expr] = []
-    for ptrname, (ptr, ptr_cnstrs) in constrs.items():
+    for ptrname, (_, is_single, ptr_cnstrs) in constrs.items():
         if ptrname not in present_ptrs:
             continue
         anchor = qlutils.subject_paths_substitute(
@@ -153,33 +221,35 @@ def _compile_conflict_select(
         ptr_val = qlast.Path(partial=True, steps=[
             qlast.Ptr(ptr=qlast.ObjectRef(name=ptrname))
         ])
-        ptr, ptr_cnstrs = constrs[ptrname]
-        ptr_card = ptr.get_cardinality(ctx.env.schema)
 
         for cnstr in ptr_cnstrs:
             lhs: qlast.Expr = anchor
             rhs: qlast.Expr = ptr_val
             # If there is a subjectexpr, substitute our lhs and rhs in
             # for __subject__ in the subjectexpr and compare *that*
-            if (subjectexpr := cnstr.get_subjectexpr(ctx.env.schema)):
+            if (subjectexpr := _get_subjectexpr(cnstr, ctx=ctx)):
                 assert isinstance(subjectexpr.qlast, qlast.Expr)
-                lhs = qlutils.subject_substitute(subjectexpr.qlast, lhs)
-                rhs = qlutils.subject_substitute(subjectexpr.qlast, rhs)
+                lhs = qlutils.subject_substitute(
+                    subjectexpr.qlast, lhs, paths_cache=paths_cache)
+                rhs = qlutils.subject_substitute(
+                    subjectexpr.qlast, rhs, paths_cache=paths_cache)
 
             conds.append(qlast.BinOp(
-                op='=' if ptr_card.is_single() else 'IN',
+                op='=' if is_single else 'IN',
                 left=lhs, right=rhs,
             ))
 
     insert_subject = qlast.Path(steps=[
-        s_utils.name_to_ast_ref(subject_typ.get_name(ctx.env.schema))])
+        s_utils.name_to_ast_ref(subject_typ.get_name(schema))])
 
     for constr in obj_constrs:
         # TODO: learn to skip irrelevant ones for UPDATEs at least?
-        subjectexpr = constr.get_subjectexpr(ctx.env.schema)
+        subjectexpr = _get_subjectexpr(constr, ctx=ctx)
         assert subjectexpr and isinstance(subjectexpr.qlast, qlast.Expr)
-        lhs = qlutils.subject_paths_substitute(subjectexpr.qlast, ptr_anchors)
-        rhs = qlutils.subject_substitute(subjectexpr.qlast, insert_subject)
+        lhs = qlutils.subject_paths_substitute(
+            subjectexpr.qlast, ptr_anchors, paths_cache=paths_cache)
+        rhs = qlutils.subject_substitute(
+            subjectexpr.qlast, insert_subject, paths_cache=paths_cache)
         conds.append(qlast.BinOp(op='=', left=lhs, right=rhs))
 
     if not conds:
@@ -216,24 +286,69 @@ def _compile_conflict_select(
     return select_ast
 
 
+def _get_ancestors(
+    obj: s_obj.InheritingObjectT,
+    *, ctx: context.ContextLevel,
+) -> Tuple[s_obj.InheritingObjectT, ...]:
+    cache = ctx.env.ancestors_cache
+    ancs = cache.get(obj.id)
+    if ancs is None:
+        schema = ctx.env.schema
+        ancs = cache[obj.id] = obj.get_ancestors(schema).objects(schema)
+    return cast(Tuple[s_obj.InheritingObjectT, ...], ancs)
+
+
+def _get_descendants(
+    obj: s_obj.InheritingObjectT,
+    *, ctx: context.ContextLevel,
+) -> Tuple[s_obj.InheritingObjectT, ...]:
+    # N.B: The cached descendants won't include views derived after
+    # the first lookup, but all our callers ignore views anyway.
+    cache = ctx.env.descendants_cache
+    descs = cache.get(obj.id)
+    if descs is None:
+        descs = cache[obj.id] = tuple(obj.descendants(ctx.env.schema))
+    return cast(Tuple[s_obj.InheritingObjectT, ...], descs)
+
+
+def _get_children(
+    obj: s_obj.InheritingObjectT,
+    *, ctx: context.ContextLevel,
+) -> Tuple[s_obj.InheritingObjectT, ...]:
+    # N.B: Same caveat about views as in _get_descendants() applies.
+    cache = ctx.env.children_cache
+    children = cache.get(obj.id)
+    if children is None:
+        children = cache[obj.id] = tuple(obj.children(ctx.env.schema))
+    return cast(Tuple[s_obj.InheritingObjectT, ...], children)
+
+
 def _constr_matters(
     constr: s_constr.Constraint, ctx: context.ContextLevel,
 ) -> bool:
+    cache = ctx.env.constr_matters_cache
+    if (matters := cache.get(constr.id)) is not None:
+        return matters
+
     schema = ctx.env.schema
-    return (
+    matters = (
         not constr.generic(schema)
         and not constr.get_delegated(schema)
         and (
             constr.get_owned(schema)
             or all(anc.get_delegated(schema) or anc.generic(schema) for anc
-                   in constr.get_ancestors(schema).objects(schema))
+                   in _get_ancestors(constr, ctx=ctx))
         )
     )
+    cache[constr.id] = matters
+    return matters
 
 
+# Maps pointer names to the pointer, whether it is single, and the
+# exclusive constraints on it.
 PointerConstraintMap = Dict[
     str,
-    Tuple[s_pointers.Pointer, List[s_constr.Constraint]],
+    Tuple[s_pointers.Pointer, bool, List[s_constr.Constraint]],
 ]
 ConstraintPair = Tuple[PointerConstraintMap, List[s_constr.Constraint]]
 ConflictTypeMap = Dict[s_objtypes.ObjectType, ConstraintPair]
@@ -249,9 +364,10 @@ def _split_constraints(
     type_maps: ConflictTypeMap = {}
 
     # Split up pointer constraints by what object types they come from
-    for name, (_, p_constrs) in constrs.items():
+    for name, (_, is_single, p_constrs) in constrs.items():
         for p_constr in p_constrs:
-            ancs = (p_constr,) + p_constr.get_ancestors(schema).objects(schema)
+            ancs = itertools.chain(
+                (p_constr,), _get_ancestors(p_constr, ctx=ctx))
             for anc in ancs:
                 if not _constr_matters(anc, ctx):
                     continue
@@ -260,12 +376,17 @@ def _split_constraints(
                 obj = p_ptr.get_source(schema)
                 assert isinstance(obj, s_objtypes.ObjectType)
                 map, _ = type_maps.setdefault(obj, ({}, []))
-                _, entry = map.setdefault(name, (p_ptr, []))
+                if name not in map:
+                    # Cardinality is inherited and must agree with the
+                    # bases, so the ancestor pointer shares ours.
+                    map[name] = (p_ptr, is_single, [])
+                _, _, entry = map[name]
                 entry.append(anc)
 
     # Split up object constraints by what object types they come from
     for obj_constr in obj_constrs:
-        ancs = (obj_constr,) + obj_constr.get_ancestors(schema).objects(schema)
+        ancs = itertools.chain(
+            (obj_constr,), _get_ancestors(obj_constr, ctx=ctx))
         for anc in ancs:
             if not _constr_matters(anc, ctx):
                 continue
@@ -282,7 +403,7 @@ def compile_conflict_select(
     subject_typ: s_objtypes.ObjectType,
     *,
     for_inheritance: bool=False,
-    fake_dml_set: Optional[irast.Set]=None,
+    get_fake_dml_set: Optional[Callable[[], irast.Set]]=None,
     obj_constrs: Sequence[s_constr.Constraint],
     constrs: PointerConstraintMap,
     parser_context: Optional[pctx.ParserContext],
@@ -310,7 +431,7 @@ def compile_conflict_select(
         frag = _compile_conflict_select(
             stmt, a_obj, obj_constrs=a_obj_constrs, constrs=a_constrs,
             for_inheritance=for_inheritance,
-            fake_dml_set=fake_dml_set,
+            get_fake_dml_set=get_fake_dml_set,
             parser_context=parser_context, ctx=ctx,
         )
         if frag:
@@ -319,9 +440,17 @@ def compile_conflict_select(
             frags.append(frag)
 
     always_check = from_parent or any(
-        not child.is_view(schema) for child in subject_typ.children(schema)
+        not child.is_view(schema)
+        for child in _get_children(subject_typ, ctx=ctx)
     )
 
+    if not frags and for_inheritance:
+        # Nothing can conflict, and inheritance checks throw away empty
+        # selects, so don't bother running an empty set literal through
+        # the compiler and attaching it to the scope tree.
+        empty_ir = setgen.new_empty_set(alias=ctx.aliases.get('e'), ctx=ctx)
+        return empty_ir, always_check, from_parent
+
     # Union them all together
     select_ast = qlast.Set(elements=frags)
     with ctx.new() as ectx:
@@ -334,14 +463,30 @@ def compile_conflict_select(
     return select_ir, always_check, from_parent
 
 
+def _get_exclusive_constr(
+    *, ctx: context.ContextLevel,
+) -> s_constr.Constraint:
+    if ctx.env.exclusive_constr is None:
+        ctx.env.exclusive_constr = ctx.env.schema.get(
+            'std::exclusive', type=s_constr.Constraint)
+    return ctx.env.exclusive_constr
+
+
 def _get_exclusive_ptr_constraints(
     typ: s_objtypes.ObjectType,
     *, ctx: context.ContextLevel,
-) -> Dict[str, Tuple[s_pointers.Pointer, List[s_constr.Constraint]]]:
+) -> PointerConstraintMap:
+    # The constraints come from non-derived pointers, which the
+    # compilation never modifies, so the result is valid for the
+    # whole compilation even as ctx.env.schema grows derived objects.
+    cache = ctx.env.exclusive_ptr_constraints_cache
+    if (pointers := cache.get(typ)) is not None:
+        return pointers
+
     schema = ctx.env.schema
     pointers = {}
 
-    exclusive_constr = schema.get('std::exclusive', type=s_constr.Constraint)
+    exclusive_constr = _get_exclusive_constr(ctx=ctx)
     for ptr in typ.get_pointers(schema).objects(schema):
         ptr = ptr.get_nearest_non_derived_parent(schema)
         ex_cnstrs = [c for c in ptr.get_constraints(schema).objects(schema)
@@ -349,8 +494,10 @@ def _get_exclusive_ptr_constraints(
         if ex_cnstrs:
             name = ptr.get_shortname(schema).name
             if name != 'id':
-                pointers[name] = ptr, ex_cnstrs
+                is_single = ptr.get_cardinality(schema).is_single()
+                pointers[name] = ptr, is_single, ex_cnstrs
 
+    cache[typ] = pointers
     return pointers
 
 
@@ -364,8 +511,9 @@ def compile_insert_unless_conflict(
     This requires synthesizing a conditional based on all the exclusive
     constraints on the object.
     """
+    schema = ctx.env.schema
     pointers = _get_exclusive_ptr_constraints(typ, ctx=ctx)
-    obj_constrs = typ.get_constraints(ctx.env.schema).objects(ctx.env.schema)
+    obj_constrs = typ.get_constraints(schema).objects(schema)
 
     select_ir, always_check, _ = compile_conflict_select(
         stmt, typ,
@@ -418,7 +566,7 @@ def compile_insert_unless_conflict_on(
     schema = ctx.env.schema
 
     ptrs = []
-    exclusive_constr = schema.get('std::exclusive', type=s_constr.Constraint)
+    exclusive_constr = _get_exclusive_constr(ctx=ctx)
     for cspec_arg in cspec_args:
         assert cspec_arg.rptr is not None
         schema, ptr = (
@@ -455,8 +603,13 @@ def compile_insert_unless_conflict_on(
             context=constraint_spec.context,
         )
 
-    ds = {ptr.get_shortname(schema).name: (ptr, field_constrs)
+    # All of ptrs were checked to be single above
+    ds = {ptr.get_shortname(schema).name: (ptr, True, field_constrs)
           for ptr in ptrs}
+    # Even though there is exactly one constraint, we can't skip
+    # splitting it up by type: it may be inherited from an ancestor
+    # (in which case the conflict select must range over that type)
+    # or be redeclared along the way, contributing several selects.
     select_ir, always_check, from_anc = compile_conflict_select(
         stmt, typ, constrs=ds, obj_constrs=list(obj_constrs),
         parser_context=stmt.context, ctx=ctx)
@@ -490,12 +643,44 @@ def compile_insert_unless_conflict_on(
     )
 
 
+ConflictEntry = Tuple[s_constr.Constraint, ConstraintPair]
+
+
+def _get_inheritance_conflict_entries(
+    typ: s_objtypes.ObjectType,
+    *, ctx: context.ContextLevel,
+) -> List[ConflictEntry]:
+    """Split the exclusive constraints of *typ* into one entry each."""
+    schema = ctx.env.schema
+    pointers = _get_exclusive_ptr_constraints(typ, ctx=ctx)
+    obj_constrs = typ.get_constraints(schema).objects(schema)
+
+    # This is a little silly, but for *this* we need to do one per
+    # constraint (so that we can properly identify which constraint
+    # failed in the error messages)
+    entries: List[ConflictEntry] = []
+    for name, (ptr, is_single, ptr_constrs) in pointers.items():
+        for ptr_constr in ptr_constrs:
+            if _constr_matters(ptr_constr, ctx):
+                entries.append((
+                    ptr_constr,
+                    ({name: (ptr, is_single, [ptr_constr])}, []),
+                ))
+    for obj_constr in obj_constrs:
+        if _constr_matters(obj_constr, ctx):
+            entries.append((obj_constr, ({}, [obj_constr])))
+
+    return entries
+
+
 def compile_inheritance_conflict_selects(
     stmt: irast.MutatingStmt,
     conflict: irast.MutatingStmt,
     typ: s_objtypes.ObjectType,
     subject_type: s_objtypes.ObjectType,
-    *, ctx: context.ContextLevel,
+    *,
+    entries: Sequence[ConflictEntry],
+    ctx: context.ContextLevel,
 ) -> List[irast.OnConflictClause]:
     """Compile the selects needed to resolve multiple DML to related types
 
@@ -506,38 +691,34 @@ def compile_inheritance_conflict_selects(
     This is needed because we mostly use triggers to enforce these
     cross-type exclusive constraints, and they use a snapshot
     beginning at the start of the statement.
-    """
-    pointers = _get_exclusive_ptr_constraints(typ, ctx=ctx)
-    obj_constrs = typ.get_constraints(ctx.env.schema).objects(
-        ctx.env.schema)
-
-    # This is a little silly, but for *this* we need to do one per
-    # constraint (so that we can properly identify which constraint
-    # failed in the error messages)
-    entries: List[Tuple[s_constr.Constraint, ConstraintPair]] = []
-    for name, (ptr, ptr_constrs) in pointers.items():
-        for ptr_constr in ptr_constrs:
-            if _constr_matters(ptr_constr, ctx):
-                entries.append((ptr_constr, ({name: (ptr, [ptr_constr])}, [])))
-    for obj_constr in obj_constrs:
-        if _constr_matters(obj_constr, ctx):
-            entries.append((obj_constr, ({}, [obj_constr])))
 
+    `entries` are the exclusive constraints of `typ`, as produced by
+    _get_inheritance_conflict_entries().
+    """
     # For updates, we need to pull from the actual result overlay,
     # since the final row can depend on things not in the query.
-    fake_dml_set = None
+    # It is only compiled once some conflict select actually asks
+    # for it, since none of them might.
+    fake_dml_set: Optional[irast.Set] = None
+    get_fake_dml_set: Optional[Callable[[], irast.Set]] = None
     if isinstance(stmt, irast.UpdateStmt):
-        fake_subject = qlast.DetachedExpr(expr=qlast.Path(steps=[
-            s_utils.name_to_ast_ref(subject_type.get_name(ctx.env.schema))]))
+        def _get_fake_dml_set() -> irast.Set:
+            nonlocal fake_dml_set
+            if fake_dml_set is None:
+                fake_subject = qlast.DetachedExpr(expr=qlast.Path(steps=[
+                    s_utils.name_to_ast_ref(
+                        subject_type.get_name(ctx.env.schema))]))
+                fake_dml_set = dispatch.compile(fake_subject, ctx=ctx)
+            return fake_dml_set
 
-        fake_dml_set = dispatch.compile(fake_subject, ctx=ctx)
+        get_fake_dml_set = _get_fake_dml_set
 
     clauses = []
     for cnstr, (p, o) in entries:
         select_ir, _, _ = compile_conflict_select(
             stmt, typ,
             for_inheritance=True,
-            fake_dml_set=fake_dml_set,
+            get_fake_dml_set=get_fake_dml_set,
             constrs=p,
             obj_constrs=o,
             parser_context=stmt.context, ctx=ctx)
@@ -548,7 +729,8 @@ def compile_inheritance_conflict_selects(
             irast.OnConflictClause(
                 constraint=cnstr_ref, select_ir=select_ir, always_check=False,
                 else_ir=None, else_fail=conflict,
-                update_query_set=fake_dml_set)
+                update_query_set=(
+                    get_fake_dml_set() if get_fake_dml_set else None))
         )
     return clauses
 
@@ -562,36 +744,44 @@ def compile_inheritance_conflict_checks(
         return None
 
     assert isinstance(subject_stype, s_objtypes.ObjectType)
+    schema = ctx.env.schema
     # TODO: when the conflicting statement is an UPDATE, only
     # look at things it updated
-    modified_ancestors = set()
-    base_object = ctx.env.schema.get(
-        'std::BaseObject', type=s_objtypes.ObjectType)
+    modified_ancestors: Dict[
+        s_objtypes.ObjectType,
+        Set[Tuple[s_objtypes.ObjectType, irast.MutatingStmt]],
+    ] = {}
+    base_object = schema.get('std::BaseObject', type=s_objtypes.ObjectType)
+
+    common_ancs: Dict[
+        Tuple[s_objtypes.ObjectType, s_objtypes.ObjectType],
+        List[s_objtypes.ObjectType],
+    ] = {}
 
     subject_stypes = [subject_stype]
     # For updates, we need to also consider all descendants, because
     # those could also have interesting constraints of their own.
     if isinstance(stmt, irast.UpdateStmt):
-        subject_stypes.extend(subject_stype.descendants(ctx.env.schema))
+        subject_stypes.extend(_get_descendants(subject_stype, ctx=ctx))
 
     # N.B that for updates, the update itself will be in dml_stmts,
     # since an update can conflict with itself if there are subtypes.
     for ir in ctx.env.dml_stmts:
         typ = setgen.get_set_type(ir.subject, ctx=ctx)
         assert isinstance(typ, s_objtypes.ObjectType)
-        typ = typ.get_nearest_non_derived_parent(ctx.env.schema)
+        typ = typ.get_nearest_non_derived_parent(schema)
 
         typs = [typ]
         # As mentioned above, need to consider descendants of updates
         if isinstance(ir, irast.UpdateStmt):
-            typs.extend(typ.descendants(ctx.env.schema))
+            typs.extend(_get_descendants(typ, ctx=ctx))
 
         for typ in typs:
-            if typ.is_view(ctx.env.schema):
+            if typ.is_view(schema):
                 continue
 
             for subject_stype in subject_stypes:
-                if subject_stype.is_view(ctx.env.schema):
+                if subject_stype.is_view(schema):
                     continue
 
                 # If the earlier DML has a shared ancestor that isn't
@@ -603,15 +793,26 @@ def compile_inheritance_conflict_checks(
                     and not isinstance(stmt, irast.UpdateStmt)
                 ):
                     continue
-                ancs = s_utils.get_class_nearest_common_ancestors(
-                    ctx.env.schema, [subject_stype, typ])
+                pair = (subject_stype, typ)
+                if (ancs := common_ancs.get(pair)) is None:
+                    ancs = s_utils.get_class_nearest_common_ancestors(
+                        schema, [subject_stype, typ])
+                    common_ancs[pair] = ancs
+
                 for anc in ancs:
                     if anc != base_object:
-                        modified_ancestors.add((subject_stype, anc, ir))
+                        modified_ancestors.setdefault(anc, set()).add(
+                            (subject_stype, ir))
 
     conflicters = []
-    for subject_stype, anc_type, ir in modified_ancestors:
-        conflicters.extend(compile_inheritance_conflict_selects(
-            stmt, ir, anc_type, subject_stype, ctx=ctx))
+    for anc_type, anc_users in modified_ancestors.items():
+        # The constraints depend only on the ancestor, so split them
+        # up once and reuse them for every statement that shares it.
+        entries = _get_inheritance_conflict_entries(anc_type, ctx=ctx)
+        if not entries:
+            continue
+        for subject_stype, ir in anc_users:
+            conflicters.extend(compile_inheritance_conflict_selects(
+                stmt, ir, anc_type, subject_stype, entries=entries, ctx=ctx))
 
     return conflicters or None
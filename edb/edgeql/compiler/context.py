@@ -48,6 +48,8 @@ from edb.schema import types as s_types
 from .options import GlobalCompilerOptions
 
 if TYPE_CHECKING:
+    from edb.schema import constraints as s_constr
+    from edb.schema import expr as s_expr
     from edb.schema import objtypes as s_objtypes
     from edb.schema import sources as s_sources
 
@@ -207,6 +209,53 @@ class Environment:
     ptr_ref_cache: PointerRefCache
     type_ref_cache: Dict[irtyputils.TypeRefCacheKey, irast.TypeRef]
 
+    # Caches for costly operations in edb.edgeql.compiler.conflicts
+    exclusive_constr: Optional[s_constr.Constraint]
+    """The std::exclusive constraint, resolved on first use."""
+
+    exclusive_ptr_constraints_cache: Dict[
+        s_objtypes.ObjectType,
+        Dict[
+            str,
+            Tuple[s_pointers.Pointer, bool, List[s_constr.Constraint]],
+        ],
+    ]
+    """A mapping of object types to their exclusive pointer constraints."""
+
+    constr_matters_cache: Dict[uuid.UUID, bool]
+    """Whether a constraint needs to be checked by conflict selects."""
+
+    constr_subjectexpr_cache: Dict[uuid.UUID, Optional[s_expr.Expression]]
+    """A mapping of constraint ids to their subject expressions."""
+
+    subject_ptrs_cache: Dict[uuid.UUID, FrozenSet[str]]
+    """Names of the subject pointers referenced by a constraint subject
+    expression or a computed pointer, keyed by the owning object id."""
+
+    subject_expr_paths_cache: Dict[qlast.Base, List[qlast.Path]]
+    """Paths found in the expressions that conflict selects substitute
+    subjects into, so that each template is only searched once."""
+
+    ancestors_cache: Dict[uuid.UUID, Tuple[s_obj.InheritingObject, ...]]
+    """A mapping of schema object ids to their ancestors."""
+
+    descendants_cache: Dict[uuid.UUID, Tuple[s_obj.InheritingObject, ...]]
+    """A mapping of schema object ids to their descendants.
+
+    Entries are not refreshed when the compilation derives new objects,
+    so views created after the first lookup may be missing.
+    """
+
+    children_cache: Dict[uuid.UUID, Tuple[s_obj.InheritingObject, ...]]
+    """A mapping of schema object ids to their children.
+
+    Like descendants_cache, this may be missing views that were
+    derived after the first lookup.
+    """
+
+    pointers_by_name_cache: Dict[uuid.UUID, Dict[str, s_pointers.Pointer]]
+    """A mapping of object type ids to their pointers by short name."""
+
     dml_exprs: List[qlast.Base]
     """A list of DML expressions (statements and DML-containing
     functions) that appear in a function body.
@@ -263,6 +312,16 @@ class Environment:
         self.created_schema_objects = set()
         self.ptr_ref_cache = PointerRefCache()
         self.type_ref_cache = {}
+        self.exclusive_constr = None
+        self.exclusive_ptr_constraints_cache = {}
+        self.constr_matters_cache = {}
+        self.constr_subjectexpr_cache = {}
+        self.subject_ptrs_cache = {}
+        self.subject_expr_paths_cache = {}
+        self.ancestors_cache = {}
+        self.descendants_cache = {}
+        self.children_cache = {}
+        self.pointers_by_name_cache = {}
         self.dml_exprs = []
         self.dml_stmts = set()
         self.pointer_derivation_map = collections.defaultdict(list)
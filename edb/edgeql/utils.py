@@ -155,12 +155,36 @@ def find_subject_ptrs(ast: qlast.Base) -> Set[str]:
     return ptrs
 
 
+def _copy_with_paths(
+    ast: qlast.Base_T,
+    paths_cache: Optional[Dict[qlast.Base, List[qlast.Path]]],
+) -> Tuple[qlast.Base_T, List[qlast.Path]]:
+    """Deep copy *ast* and return the copy along with all of its paths.
+
+    If *paths_cache* is given, the paths of the original tree are looked
+    up there (and recorded on a miss) and mapped onto the copy, instead
+    of searching the freshly copied tree.
+    """
+    if paths_cache is None:
+        ast = copy.deepcopy(ast)
+        return ast, find_paths(ast)
+
+    paths = paths_cache.get(ast)
+    if paths is None:
+        paths = paths_cache[ast] = find_paths(ast)
+    memo: Dict[int, Any] = {}
+    copied = copy.deepcopy(ast, memo)
+    return copied, [memo[id(path)] for path in paths]
+
+
 def subject_paths_substitute(
     ast: qlast.Base_T,
     subject_ptrs: Dict[str, qlast.Expr],
+    *,
+    paths_cache: Optional[Dict[qlast.Base, List[qlast.Path]]] = None,
 ) -> qlast.Base_T:
-    ast = copy.deepcopy(ast)
-    for path in find_paths(ast):
+    ast, paths = _copy_with_paths(ast, paths_cache)
+    for path in paths:
         if path.partial and isinstance(path.steps[0], qlast.Ptr):
             path.steps[0] = subject_paths_substitute(
                 subject_ptrs[path.steps[0].ptr.name],
@@ -179,9 +203,13 @@ def subject_paths_substitute(
 
 
 def subject_substitute(
-        ast: qlast.Base_T, new_subject: qlast.Expr) -> qlast.Base_T:
-    ast = copy.deepcopy(ast)
-    for path in find_paths(ast):
+    ast: qlast.Base_T,
+    new_subject: qlast.Expr,
+    *,
+    paths_cache: Optional[Dict[qlast.Base, List[qlast.Path]]] = None,
+) -> qlast.Base_T:
+    ast, paths = _copy_with_paths(ast, paths_cache)
+    for path in paths:
         if isinstance(path.steps[0], qlast.Subject):
             path.steps[0] = new_subject
     return ast
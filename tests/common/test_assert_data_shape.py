@@ -0,0 +1,92 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2022-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import unittest
+
+from edb.common.assert_data_shape import assert_data_shape, bag
+
+
+class TestAssertDataShapeBag(unittest.TestCase):
+
+    def assert_shape(self, data, shape):
+        assert_data_shape(data, shape, self.fail)
+
+    def test_bag_scalars_01(self):
+        self.assert_shape([1, 2, 3], bag([3, 1, 2]))
+        self.assert_shape(['a', 'b'], bag(['b', 'a']))
+        self.assert_shape([b'x', b'y'], bag([b'y', b'x']))
+
+    def test_bag_scalars_02(self):
+        # Duplicates have to be matched one for one.
+        self.assert_shape(['a', 'a', 'b'], bag(['a', 'b', 'a']))
+
+        with self.assertRaisesRegex(
+                AssertionError,
+                r"missing elements in list PATH: <top-level>: 'a'"):
+            self.assert_shape(['a', 'b', 'b'], bag(['a', 'a', 'b']))
+
+    def test_bag_scalars_03(self):
+        with self.assertRaisesRegex(
+                AssertionError,
+                r"data shape differs: missing elements in list "
+                r"PATH: <top-level>: 3"):
+            self.assert_shape([1, 2], bag([1, 2, 3]))
+
+        with self.assertRaisesRegex(
+                AssertionError, r'too many elements in list'):
+            self.assert_shape([1, 2, 3], bag([1, 2]))
+
+    def test_bag_mixed_01(self):
+        self.assert_shape(
+            [{'name': 'Imp'}, 'Imp', 2, {'name': 'Dragon'}],
+            bag(['Imp', {'name': 'Dragon'}, 2, {'name': 'Imp'}]),
+        )
+
+        with self.assertRaisesRegex(
+                AssertionError,
+                r"missing elements in list PATH: <top-level>: "
+                r"\{'name': 'Golem'\}"):
+            self.assert_shape(
+                [{'name': 'Imp'}, 'Imp'],
+                bag(['Imp', {'name': 'Golem'}]),
+            )
+
+    def test_bag_mixed_02(self):
+        # A type sentinel matches any value of that type, alongside
+        # literals that have to match exactly.
+        self.assert_shape(['bar', 'foo'], bag(['foo', str]))
+        self.assert_shape(['foo', 'bar'], bag(['foo', str]))
+
+        with self.assertRaisesRegex(
+                AssertionError,
+                r"missing elements in list PATH: <top-level>: 'baz'"):
+            self.assert_shape(['foo', 'bar'], bag([str, 'baz']))
+
+    def test_bag_nested_01(self):
+        self.assert_shape(
+            [{'elements': ['b', 'a']}, {'elements': ['c']}],
+            bag([{'elements': bag(['c'])}, {'elements': bag(['a', 'b'])}]),
+        )
+
+        with self.assertRaisesRegex(
+                AssertionError, r'missing elements in list'):
+            self.assert_shape(
+                [{'elements': ['b', 'a']}],
+                bag([{'elements': bag(['a', 'c'])}]),
+            )